@@ -3,19 +3,55 @@ Base scraper class providing common functionality for all vendor scrapers.
 """
 
 import logging
+import re
+import threading
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass
 from urllib.parse import urljoin, urlparse
 import requests
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 from fake_useragent import UserAgent
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
 
 from .product_model import ProductInfo
 
+try:
+    import requests_cache
 
-@dataclass
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+_CURRENCY_AND_SEPARATORS_RE = re.compile(r"[£$€¥,]")
+_FIRST_NUMBER_RE = re.compile(r"(\d+\.?\d*)")
+
+
+class AnyOfStrainer(SoupStrainer):
+    """
+    SoupStrainer that keeps a tag when any one of several strainers would.
+
+    A single SoupStrainer requires every attribute rule to match, so it can't
+    express "this id or that class". Once a tag is kept, its whole subtree is kept.
+    """
+
+    def __init__(self, *strainers: SoupStrainer):
+        super().__init__()
+        self.strainers = strainers
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        """Tag filter hook used by beautifulsoup4 >= 4.13."""
+        return any(strainer.allow_tag_creation(nsprefix, name, attrs) for strainer in self.strainers)
+
+    def search_tag(self, markup_name=None, markup_attrs={}):
+        """Tag filter hook used by beautifulsoup4 < 4.13."""
+        return any(strainer.search_tag(markup_name, markup_attrs) for strainer in self.strainers)
+
+
+@dataclass(slots=True)
 class ScrapingResult:
     """Result of a scraping operation"""
 
@@ -41,6 +77,9 @@ class BaseScraper(ABC):
     rate limiting, and standardized interfaces that all vendor scrapers inherit.
     """
 
+    # Optional SoupStrainer limiting parsing to the parts of the page the extractors read
+    html_strainer: Optional[SoupStrainer] = None
+
     def __init__(
         self,
         vendor_name: str,
@@ -49,6 +88,7 @@ class BaseScraper(ABC):
         timeout: int = 30,
         max_retries: int = 3,
         custom_headers: Optional[Dict[str, str]] = None,
+        cache_path: Optional[str] = None,
     ):
         """
         Initialize the base scraper.
@@ -60,6 +100,7 @@ class BaseScraper(ABC):
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
             custom_headers: Additional HTTP headers to include
+            cache_path: SQLite file for an on-disk HTTP response cache (requires requests-cache)
         """
         self.vendor_name = vendor_name
         self.base_url = base_url
@@ -70,8 +111,21 @@ class BaseScraper(ABC):
         # Set up logging
         self.logger = logging.getLogger(f"{__name__}.{vendor_name}")
 
-        # Initialize HTTP session
-        self.session = requests.Session()
+        # Initialize HTTP session, backed by an on-disk response cache when requested
+        self.response_cache_enabled = bool(cache_path) and REQUESTS_CACHE_AVAILABLE
+        if self.response_cache_enabled:
+            # 404s are cached too so dead part numbers aren't re-fetched on every run
+            self.session = requests_cache.CachedSession(
+                cache_path,
+                backend="sqlite",
+                expire_after=timedelta(hours=24),
+                allowable_codes=(200, 404),
+                cache_control=True,
+            )
+        else:
+            if cache_path:
+                self.logger.warning("requests-cache is not installed, HTTP responses will not be cached")
+            self.session = requests.Session()
 
         # Set up default headers
         ua = UserAgent()
@@ -88,21 +142,39 @@ class BaseScraper(ABC):
             self.default_headers.update(custom_headers)
 
         self.session.headers.update(self.default_headers)
+        self._connection_pool_size = DEFAULT_POOLSIZE
 
-        # Rate limiting
+        # Rate limiting (the lock keeps the delay honoured across worker threads)
         self._last_request_time = 0
+        self._rate_limit_lock = threading.Lock()
 
     def _enforce_rate_limit(self) -> None:
         """Enforce rate limiting between requests"""
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
+        with self._rate_limit_lock:
+            current_time = time.time()
+            time_since_last = current_time - self._last_request_time
+
+            if time_since_last < self.delay_between_requests:
+                sleep_time = self.delay_between_requests - time_since_last
+                self.logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
+                time.sleep(sleep_time)
+
+            self._last_request_time = time.time()
+
+    def _ensure_connection_pool(self, size: int) -> None:
+        """
+        Grow the session's per-host connection pool to hold at least size connections.
 
-        if time_since_last < self.delay_between_requests:
-            sleep_time = self.delay_between_requests - time_since_last
-            self.logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
+        Concurrent workers beyond the pool size would otherwise have their connections
+        discarded after each request, paying a new TCP/TLS handshake every time.
+        """
+        if size <= self._connection_pool_size:
+            return
 
-        self._last_request_time = time.time()
+        adapter = HTTPAdapter(pool_maxsize=size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._connection_pool_size = size
 
     def _make_request(self, url: str, **kwargs) -> requests.Response:
         """
@@ -116,14 +188,24 @@ class BaseScraper(ABC):
             Response object
 
         Raises:
-            requests.RequestException: If all retry attempts fail
+            requests.RequestException: If all retry attempts fail, or at once for a
+                client error (other than 429) or a cached error response
         """
-        self._enforce_rate_limit()
-
         # Ensure absolute URL
         if not url.startswith(("http://", "https://")):
             url = urljoin(self.base_url, url)
 
+        # Cached responses never reach the site, so serve them without rate limiting or retries.
+        # A miss comes back as requests-cache's 504 "Not Cached", a status that is never stored.
+        if self.response_cache_enabled and not kwargs.get("force_refresh"):
+            response = self.session.get(url, timeout=self.timeout, only_if_cached=True, **kwargs)
+            if getattr(response, "from_cache", False) and response.status_code != 504:
+                self.logger.debug(f"Serving {url} from the response cache")
+                response.raise_for_status()
+                return response
+
+        self._enforce_rate_limit()
+
         for attempt in range(self.max_retries + 1):
             try:
                 self.logger.debug(f"Making request to {url} (attempt {attempt + 1})")
@@ -135,6 +217,12 @@ class BaseScraper(ABC):
             except requests.exceptions.RequestException as e:
                 self.logger.warning(f"Request attempt {attempt + 1} failed: {e}")
 
+                # Client errors such as a 404 for a dead part number won't change on retry;
+                # only 429 Too Many Requests is worth backing off for
+                status = e.response.status_code if e.response is not None else None
+                if status is not None and 400 <= status < 500 and status != 429:
+                    raise
+
                 if attempt == self.max_retries:
                     self.logger.error(f"All {self.max_retries + 1} attempts failed for {url}")
                     raise
@@ -144,17 +232,17 @@ class BaseScraper(ABC):
                 self.logger.info(f"Retrying in {sleep_time:.2f} seconds...")
                 time.sleep(sleep_time)
 
-    def _parse_html(self, html_content: str) -> BeautifulSoup:
+    def _parse_html(self, html_content: Union[str, bytes]) -> BeautifulSoup:
         """
         Parse HTML content using BeautifulSoup.
 
         Args:
-            html_content: Raw HTML string
+            html_content: Raw HTML string, or undecoded response bytes
 
         Returns:
             BeautifulSoup object
         """
-        return BeautifulSoup(html_content, "lxml")
+        return BeautifulSoup(html_content, "lxml", parse_only=self.html_strainer)
 
     def _extract_text_safe(self, element, default: str = "") -> str:
         """
@@ -170,7 +258,9 @@ class BaseScraper(ABC):
         if element is None:
             return default
 
-        text = element.get_text(strip=True)
+        # Leaf elements expose their single text node directly, skipping the recursive walk
+        string = element.string
+        text = string.strip() if type(string) is NavigableString else element.get_text(strip=True)
         return text if text else default
 
     def _extract_number_from_text(self, text: str) -> Optional[float]:
@@ -183,16 +273,14 @@ class BaseScraper(ABC):
         Returns:
             First number found or None
         """
-        import re
-
         if not text:
             return None
 
         # Remove common currency symbols and thousands separators
-        cleaned = re.sub(r"[£$€¥,]", "", text)
+        cleaned = _CURRENCY_AND_SEPARATORS_RE.sub("", text)
 
         # Find first number (including decimals)
-        match = re.search(r"(\d+\.?\d*)", cleaned)
+        match = _FIRST_NUMBER_RE.search(cleaned)
 
         if match:
             try:
@@ -271,30 +359,43 @@ class BaseScraper(ABC):
         """
         return [urlparse(self.base_url).netloc]
 
-    def scrape_multiple_products(self, urls: List[str]) -> List[ScrapingResult]:
+    def scrape_multiple_products(self, urls: List[str], max_workers: int = 1, **kwargs) -> List[ScrapingResult]:
         """
-        Scrape multiple products sequentially.
+        Scrape multiple products, sequentially or concurrently.
+
+        Concurrent workers share this scraper's session and rate limit, so request
+        starts are still spaced by the configured delay while their network waits overlap.
 
         Args:
             urls: List of product URLs to scrape
+            max_workers: Maximum number of pages in flight at once (1 scrapes sequentially)
+            **kwargs: Additional arguments for scrape_product, such as RS Components' fields
 
         Returns:
-            List of ScrapingResult objects
+            List of ScrapingResult objects in the same order as urls
         """
-        results = []
+        if max_workers <= 1:
+            return [self._scrape_one_of_many(i, url, len(urls), **kwargs) for i, url in enumerate(urls)]
 
-        for i, url in enumerate(urls):
-            self.logger.info(f"Scraping product {i + 1}/{len(urls)}: {url}")
+        self._ensure_connection_pool(max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._scrape_one_of_many, i, url, len(urls), **kwargs) for i, url in enumerate(urls)
+            ]
+            return [future.result() for future in futures]
 
-            try:
-                result = self.scrape_product(url)
-                results.append(result)
+    def _scrape_one_of_many(self, index: int, url: str, total: int, **kwargs) -> ScrapingResult:
+        """Scrape one product of a batch, turning any exception into a failed result."""
+        self.logger.info(f"Scraping product {index + 1}/{total}: {url}")
+
+        try:
+            result = self.scrape_product(url, **kwargs)
 
-                if not result.success:
-                    self.logger.warning(f"Failed to scrape {url}: {result.error_message}")
+            if not result.success:
+                self.logger.warning(f"Failed to scrape {url}: {result.error_message}")
 
-            except Exception as e:
-                self.logger.error(f"Unexpected error scraping {url}: {e}")
-                results.append(ScrapingResult(success=False, error_message=f"Unexpected error: {str(e)}"))
+            return result
 
-        return results
+        except Exception as e:
+            self.logger.error(f"Unexpected error scraping {url}: {e}")
+            return ScrapingResult(success=False, error_message=f"Unexpected error: {str(e)}")
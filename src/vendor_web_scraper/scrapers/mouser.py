@@ -6,14 +6,15 @@ import re
 import time
 import logging
 from decimal import Decimal
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any
 from urllib.parse import urljoin
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from bs4.element import PageElement, Tag
 import requests
+from urllib3.util.request import ACCEPT_ENCODING
 
 try:
-    from ..core.scraper_base import BaseScraper, ScrapingResult
+    from ..core.scraper_base import AnyOfStrainer, BaseScraper, ScrapingResult
     from ..core.product_model import (
         ProductInfo,
         ProductSpecifications,
@@ -28,7 +29,7 @@ except ImportError:
 
     sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
     print(str(Path(__file__).resolve().parent.parent.parent))
-    from vendor_web_scraper.core.scraper_base import BaseScraper, ScrapingResult
+    from vendor_web_scraper.core.scraper_base import AnyOfStrainer, BaseScraper, ScrapingResult
     from vendor_web_scraper.core.product_model import (
         ProductInfo,
         ProductSpecifications,
@@ -39,6 +40,31 @@ except ImportError:
     from vendor_web_scraper.core.cookie_manager import MouserCookieManager
 
 
+_MOUSER_DOMAIN = "mouser.com"
+_MOUSER_SUBDOMAIN_SUFFIX = "." + _MOUSER_DOMAIN
+# Host of an http(s) URL, which ends at the first "/", "?" or "#"
+_RE_HOST = re.compile(r"https?://([^/?#]+)")
+
+# Only the elements the extractors read; nav, footer and script blocks are never built
+_PRODUCT_STRAINER = AnyOfStrainer(
+    SoupStrainer(
+        id=re.compile(
+            r"^(?:spnDescription|spnMouserPartNumFormattedForProdInfo|spnManufacturerPartNumber"
+            r"|lnkManufacturerName|defaultImg)$"
+        )
+    ),
+    SoupStrainer(
+        class_=re.compile(
+            r"(?:^|\s)(?:bc-no-link|panel-title|breadcrumb|specs-table|pdp-product-availability-pricing)(?:\s|$)"
+        )
+    ),
+    SoupStrainer("a", itemprop="url"),
+)
+
+# Everything that isn't part of a plain decimal price, e.g. currency symbols and separators
+_NON_PRICE_CHARS_RE = re.compile(r"[^\d.]")
+
+
 class MouserScraper(BaseScraper):
     """
     Scraper for Mouser Electronics (mouser.com) product pages.
@@ -47,6 +73,8 @@ class MouserScraper(BaseScraper):
     availability, and technical details from Mouser product pages.
     """
 
+    html_strainer = _PRODUCT_STRAINER
+
     def __init__(self, **kwargs):
         """Initialize Mouser scraper."""
         # Extract cookies and custom headers before calling super()
@@ -54,7 +82,8 @@ class MouserScraper(BaseScraper):
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:141.0) Gecko/20100101 Firefox/141.0",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate, br, zstd",
+            # Only advertise encodings urllib3 can decode (br/zstd need brotli/zstandard installed)
+            "Accept-Encoding": ", ".join(ACCEPT_ENCODING.split(",")),
             "Connection": "keep-alive",
             "Upgrade-Insecure-Requests": "1",
             "Sec-Fetch-Dest": "document",
@@ -91,11 +120,14 @@ class MouserScraper(BaseScraper):
         # Get fresh cookies from the cookie manager
         cookies = self.cookie_manager.get_mouser_cookies()
 
-        # Set cookies on the session
+        # Set cookies on the session, skipping any the jar already holds with the same value
+        changed = 0
         for name, value in cookies.items():
-            self.session.cookies.set(name, value, domain=".mouser.com")
+            if self.session.cookies.get(name, domain=".mouser.com") != value:
+                self.session.cookies.set(name, value, domain=".mouser.com")
+                changed += 1
 
-        self.logger.info(f"Set {len(cookies)} Mouser cookies on session")
+        self.logger.info(f"Set {changed} of {len(cookies)} Mouser cookies on session")
 
     def refresh_cookies(self):
         """Force refresh cookies and update session."""
@@ -111,9 +143,13 @@ class MouserScraper(BaseScraper):
         """Update session cookies from response if needed."""
         # This method can be called after each request to maintain session
         if response.cookies:
+            changed = 0
             for cookie in response.cookies:
-                self.session.cookies.set(cookie.name, cookie.value, domain=cookie.domain)
-            self.logger.debug("Session cookies updated from response")
+                if self.session.cookies.get(cookie.name, domain=cookie.domain) != cookie.value:
+                    self.session.cookies.set(cookie.name, cookie.value, domain=cookie.domain)
+                    changed += 1
+            if changed:
+                self.logger.debug(f"Updated {changed} session cookies from response")
 
     def _make_request(self, url: str, **kwargs) -> requests.Response:
         """
@@ -137,7 +173,7 @@ class MouserScraper(BaseScraper):
         Returns:
             ScrapingResult with product information or error details
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Validate URL
@@ -146,10 +182,10 @@ class MouserScraper(BaseScraper):
 
             # Make request
             response = self._make_request(product_url)
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.perf_counter() - start_time) * 1000
 
-            # Parse HTML
-            soup = self._parse_html(response.text)
+            # Parse the raw body; lxml sniffs the encoding itself, so skip the decoded str copy
+            soup = self._parse_html(response.content)
 
             # Extract product information
             product_info = self.extract_product_info(soup, product_url)
@@ -164,7 +200,7 @@ class MouserScraper(BaseScraper):
         except Exception as e:
             self.logger.error(f"Error scraping {product_url}: {e}")
             return ScrapingResult(
-                success=False, error_message=str(e), response_time_ms=(time.time() - start_time) * 1000
+                success=False, error_message=str(e), response_time_ms=(time.perf_counter() - start_time) * 1000
             )
 
     def extract_product_info(self, soup: BeautifulSoup, url: str) -> ProductInfo:
@@ -178,12 +214,15 @@ class MouserScraper(BaseScraper):
         Returns:
             ProductInfo object with extracted data
         """
+        # Index id-addressed elements once instead of re-walking the tree per field
+        ids = self._index_element_ids(soup)
+
         # Extract basic product information
-        title = self._extract_title(soup)
-        vendor_part_number = self._extract_vendor_part_number(soup)
+        title = self._extract_title(soup, ids)
+        vendor_part_number = self._extract_vendor_part_number(ids)
 
         # Extract specifications
-        specifications = self._extract_specifications(soup)
+        specifications = self._extract_specifications(soup, ids)
 
         # Extract pricing
         pricing = self._extract_pricing(soup)
@@ -192,7 +231,7 @@ class MouserScraper(BaseScraper):
         availability = self._extract_availability(soup)
 
         # Extract media
-        media = self._extract_media(soup, url)
+        media = self._extract_media(ids, url)
 
         return ProductInfo(
             vendor_name=self.vendor_name,
@@ -216,87 +255,61 @@ class MouserScraper(BaseScraper):
         Returns:
             True if URL is valid for Mouser
         """
-        try:
-            from urllib.parse import urlparse
-
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-
-            # Remove www. prefix if present
-            if domain.startswith("www."):
-                domain = domain[4:]
-
-            # List of Mouser domains
-            mouser_domains = [
-                "mouser.com",
-                "au.mouser.com",
-                "uk.mouser.com",
-                "de.mouser.com",
-                "fr.mouser.com",
-                # Add other regional Mouser domains as needed
-            ]
+        match = _RE_HOST.match(url)
+        if not match:
+            return False
 
-            return domain in mouser_domains
+        # All regional Mouser sites (au., uk., de., ...) are subdomains of mouser.com
+        domain = match.group(1).lower()
+        return domain == _MOUSER_DOMAIN or domain.endswith(_MOUSER_SUBDOMAIN_SUFFIX)
 
-        except Exception:
-            return False
+    def _index_element_ids(self, soup: BeautifulSoup) -> Dict[str, Tag]:
+        """Map element ids to elements in a single tree walk (first element wins, like select_one)."""
+        ids: Dict[str, Tag] = {}
+        for element in soup.find_all(id=True):
+            ids.setdefault(element["id"], element)
+        return ids
 
-    def _extract_title(self, soup: BeautifulSoup) -> str:
+    def _extract_title(self, soup: BeautifulSoup, ids: Dict[str, Tag]) -> str:
         """Extract product title."""
         # TODO: Find Mouser's title selectors using browser inspection
-        selectors = [
-            "span.bc-no-link",
-            "span#spnDescription",
-        ]
-
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                return re.sub(r"\s+", " ", self._extract_text_safe(element).strip())
+        element = soup.select_one("span.bc-no-link") or ids.get("spnDescription")
+        if element:
+            return re.sub(r"\s+", " ", self._extract_text_safe(element).strip())
 
         return "Unknown Product"
 
-    def _extract_vendor_part_number(self, soup: BeautifulSoup) -> str:
+    def _extract_vendor_part_number(self, ids: Dict[str, Tag]) -> str:
         """Extract Mouser part number."""
-        # TODO: Find Mouser's part number selectors
-        selectors = [
-            "span#spnMouserPartNumFormattedForProdInfo",  # Mouser's product part number heading
-        ]
-
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                text = self._extract_text_safe(element)
-                if text:
-                    return text.strip()
+        # Mouser's product part number heading
+        text = self._extract_text_safe(ids.get("spnMouserPartNumFormattedForProdInfo"))
+        if text:
+            return text.strip()
 
         return "Unknown"
 
-    def _extract_specifications(self, soup: BeautifulSoup) -> ProductSpecifications:
+    def _extract_specifications(self, soup: BeautifulSoup, ids: Dict[str, Tag]) -> ProductSpecifications:
         """Extract product specifications."""
         specs = ProductSpecifications()
 
-        def cycle_selectors(selectors: List[str]) -> str:
-            """Cycle through selectors to find the first matching element."""
-            for selector in selectors:
-                element = soup.select_one(selector)
-                if element:
-                    return re.sub(r"\s+", " ", self._extract_text_safe(element).strip())
+        def first_text(element: Optional[Tag]) -> str:
+            """Whitespace-normalised text of the first matching element."""
+            if element:
+                return re.sub(r"\s+", " ", self._extract_text_safe(element).strip())
             return "Unknown"
 
-        specs.manufacturer = cycle_selectors(["a#lnkManufacturerName", 'a[itemprop="url"]'])
-        specs.manufacturer_part_number = cycle_selectors(["span#spnManufacturerPartNumber", "h1.panel-title"])
-        specs.description = cycle_selectors(["span#spnDescription", "h1.panel-title"])
+        specs.manufacturer = first_text(ids.get("lnkManufacturerName") or soup.select_one('a[itemprop="url"]'))
+        specs.manufacturer_part_number = first_text(
+            ids.get("spnManufacturerPartNumber") or soup.select_one("h1.panel-title")
+        )
+        specs.description = first_text(ids.get("spnDescription") or soup.select_one("h1.panel-title"))
 
         # Breadcrumbs for category and subcategory
         breadcrumbs = soup.select("ol.breadcrumb li a")
-        if breadcrumbs:
-            if len(breadcrumbs) >= 2:
-                specs.category = self._extract_text_safe(breadcrumbs[1])
-            if len(breadcrumbs) >= 3:
-                specs.subcategory = self._extract_text_safe(breadcrumbs[2])
-            else:
-                specs.subcategory = "Unknown"
+        crumb_count = len(breadcrumbs)
+        if crumb_count >= 2:
+            specs.category = self._extract_text_safe(breadcrumbs[1])
+            specs.subcategory = self._extract_text_safe(breadcrumbs[2]) if crumb_count >= 3 else "Unknown"
 
         # Extract technical specifications table
         specs_table = soup.select_one("table.specs-table")
@@ -332,17 +345,16 @@ class MouserScraper(BaseScraper):
 
         # Extract quantity breaks
         pricing.quantity_breaks = {}
-        rows = price_table.select("tr")
-        for row in rows:
-            if len(row.select("th")) > 1:
+        for row in price_table.find_all("tr"):
+            headers = row.find_all("th", limit=2)
+            if len(headers) > 1:
                 continue
             try:
-                qty = int(self._extract_text_safe(row.select_one("th")).strip())
-                price = self._extract_text_safe(row.select_one("td")).strip()
+                qty = int(self._extract_text_safe(headers[0] if headers else None).strip())
+                price = self._extract_text_safe(row.find("td")).strip()
                 if price:
                     # Convert price to Decimal, handling currency symbols
-                    price = re.sub(r"[^\d.]", "", price)
-                    pricing.quantity_breaks[qty] = Decimal(price)
+                    pricing.quantity_breaks[qty] = Decimal(_NON_PRICE_CHARS_RE.sub("", price))
             except (ValueError, TypeError) as e:
                 self.logger.warning(f"Error parsing quantity break: {e}")
                 continue
@@ -401,11 +413,11 @@ class MouserScraper(BaseScraper):
 
         return availability
 
-    def _extract_media(self, soup: BeautifulSoup, base_url: str) -> ProductMedia:
+    def _extract_media(self, ids: Dict[str, Tag], base_url: str) -> ProductMedia:
         """Extract product images and media."""
         media = ProductMedia()
 
-        img = soup.select_one("img", {"id": "defaultImg"})
+        img = ids.get("defaultImg")
         if img and img.has_attr("src"):
             media.primary_image_url = urljoin(base_url, img["src"])
 
@@ -418,12 +430,15 @@ class MouserScraper(BaseScraper):
         """Parse technical specifications table."""
         specs: Dict[str, str] = {}
 
-        rows = table_element.select("tr")
-        for row in rows:
-            if row.select("th"):
+        for row in table_element.find_all("tr"):
+            if row.find("th"):
                 continue  # Skip header rows
-            key = self._extract_text_safe(row.select_one("td:nth-of-type(1)")).replace(":", "")
-            value = self._extract_text_safe(row.select_one("td:nth-of-type(2)"))
+            # Spec rows are always <tr><td>key</td><td>value</td></tr>
+            cells = row.find_all("td", recursive=False)
+            if len(cells) < 2:
+                continue
+            key = self._extract_text_safe(cells[0]).replace(":", "")
+            value = self._extract_text_safe(cells[1])
             if key and value:
                 specs[key] = value
 
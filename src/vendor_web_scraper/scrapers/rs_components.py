@@ -3,16 +3,20 @@ RS Components scraper implementation.
 """
 
 import re
+import sys
 import time
 import logging
 from decimal import Decimal
-from typing import Optional, Dict, Any, List
-from urllib.parse import urljoin
-from bs4 import BeautifulSoup
+from html import unescape
+from typing import Optional, Dict, Any, Iterator, List, Set
+from urllib.parse import urljoin, urlparse
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer, UnicodeDammit
+from lxml import etree
 from bs4.element import PageElement, Tag
 
 try:
-    from ..core.scraper_base import BaseScraper, ScrapingResult
+    from ..core.scraper_base import AnyOfStrainer, BaseScraper, ScrapingResult
     from ..core.product_model import (
         ProductInfo,
         ProductSpecifications,
@@ -26,7 +30,7 @@ except ImportError:
 
     sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
     print(str(Path(__file__).resolve().parent.parent.parent))
-    from vendor_web_scraper.core.scraper_base import BaseScraper, ScrapingResult
+    from vendor_web_scraper.core.scraper_base import AnyOfStrainer, BaseScraper, ScrapingResult
     from vendor_web_scraper.core.product_model import (
         ProductInfo,
         ProductSpecifications,
@@ -36,6 +40,284 @@ except ImportError:
     )
 
 
+# RS Components domains
+_RS_DOMAINS = frozenset(
+    {
+        "rs-online.com",
+        "uk.rs-online.com",
+        "au.rs-online.com",
+        "sg.rs-online.com",
+        "export.rs-online.com",
+        "ie.rs-online.com",
+        "fr.rs-online.com",
+        "de.rs-online.com",
+    }
+)
+
+# Host of an http(s) URL, without a leading "www."
+_RE_HOST = re.compile(r"https?://(?:www\.)?([^/?#]+)", re.IGNORECASE)
+
+
+# Currency quoted by each supported regional RS site. Only sites that write prices with a
+# decimal point are listed: _parse_decimal treats commas as thousands separators, so a
+# French or German "0,15 €" would read as 15.
+_LOCALE_CURRENCIES = {
+    "au": "AUD",
+    "uk": "GBP",
+    "ie": "EUR",
+    "sg": "SGD",
+}
+
+
+# ProductInfo sections that callers may ask extract_product_info to skip
+PRODUCT_FIELDS = frozenset({"specifications", "pricing", "availability", "media"})
+
+
+def _check_fields(fields: Optional[Set[str]]) -> None:
+    """Raise ValueError if fields names anything outside PRODUCT_FIELDS."""
+    if fields is not None and not PRODUCT_FIELDS.issuperset(fields):
+        unknown = ", ".join(sorted(set(fields) - PRODUCT_FIELDS))
+        raise ValueError(f"Unknown product fields: {unknown} (expected any of {', '.join(sorted(PRODUCT_FIELDS))})")
+
+
+def _union_selector(*selectors: str) -> sv.SoupSieve:
+    """
+    Compile fallback CSS selectors into one union selector.
+
+    The union is matched in a single tree walk, so candidates are found in document
+    order rather than in the order the selectors are listed.
+    """
+    return sv.compile(", ".join(selectors))
+
+
+_PRICE_SELECTOR = _union_selector(
+    '[data-testid="exc-vat"]', ".price-current", ".unit-price", '[data-qa="unit-price"]'
+)
+_MOQ_SELECTOR = _union_selector(
+    '[data-testid="price-heading"]',
+    '[data-testid="minimum-order-quantity"]',
+    ".moq",
+    '[data-qa="moq"]',
+)
+_STOCK_SELECTOR = _union_selector(
+    '[data-testid="stock-status"]',
+    '[data-testid="stock-status-0"]',
+    '[data-testid="stock-status-1"]',
+    ".stock-status",
+    '[data-qa="availability"]',
+)
+_IMAGE_SELECTOR = _union_selector(
+    '[data-testid="gallery-fallback-image"]',
+    ".product-image img",
+    ".pdp-image img",
+    ".hero-image img",
+)
+
+# Only the elements the extractors read; nav, footer and script blocks are never built.
+# The unlabelled <dd> values are kept so they stay next to their data-testid <dt> labels.
+_PRODUCT_STRAINER = AnyOfStrainer(
+    SoupStrainer(attrs={"data-testid": True}),
+    SoupStrainer(attrs={"data-qa": True}),
+    SoupStrainer(["h1", "dd"]),
+    SoupStrainer(
+        class_=re.compile(
+            r"(?:^|\s)(?:pdp-main|price-current|unit-price|moq|price-breaks|quantity-pricing|stock-status"
+            r"|product-image|pdp-image|hero-image)(?:\s|$)"
+        )
+    ),
+)
+
+_PRODUCT_CONTAINER_SELECTOR = sv.compile('[data-testid="pdp"], .pdp-main, main')
+_INC_VAT_SELECTOR = sv.compile('[data-testid="inc-vat"]')
+_PRICE_BREAKS_SELECTOR = sv.compile('.price-breaks, .quantity-pricing, [data-testid="price-breaks"]')
+_DATASHEET_LINK_SELECTOR = sv.compile('a[href*="datasheet" i], a[title*="datasheet" i]')
+
+# Stock location/quantity ("150 In AU stock") or lead time ("5-7 working days"),
+# formatted with the scraper's locale
+_AVAILABILITY_PATTERN = (
+    r"(?P<qty>\d+)?\s*in (?P<where>{locale}|global) stock|(?P<days>\d+)(?:-\d+)?\s*(?:working\s*)?days?"
+)
+_NUM_RE = re.compile(r"\d[\d,]*(?:\.\d+)?")
+
+# Raw-page fast path for the gallery image, matched before the tree is searched. The search
+# starts at the product container so recommendation images ahead of it are skipped.
+_PDP_TAG_RE = re.compile(rb'<[a-z][^>]*\sdata-testid="pdp"', re.IGNORECASE)
+_GALLERY_IMG_TAG_RE = re.compile(rb'<img\b[^>]*\sdata-testid="gallery-fallback-image"[^>]*>', re.IGNORECASE)
+_IMG_SRC_RE = re.compile(rb'\ssrc="([^"]+)"', re.IGNORECASE)
+_IMG_SRCSET_RE = re.compile(rb'\ssrcset="([^"]*)"', re.IGNORECASE)
+
+# Separator between srcset candidates. Cloudinary image URLs carry commas of their own
+# ("c_pad,dpr_1.0,f_auto"), so only a comma followed by whitespace ends a candidate.
+_SRCSET_SEPARATOR_RE = re.compile(r",\s+")
+
+# Bytes fed to the streaming pricing parser at a time
+_PRICING_CHUNK_SIZE = 16 * 1024
+
+
+def _parse_decimal(text: str) -> Optional[Decimal]:
+    """Return the first number in text as a Decimal, ignoring thousands separators."""
+    match = _NUM_RE.search(text)
+    return Decimal(match.group().replace(",", "")) if match else None
+
+
+def _split_srcset(srcset: str) -> Iterator[str]:
+    """Yield the candidates of a srcset attribute, whatever whitespace follows each comma."""
+    return (candidate for candidate in _SRCSET_SEPARATOR_RE.split(srcset.strip()) if candidate)
+
+
+class _PricingTarget:
+    """
+    lxml parser target that collects only the text needed for a pricing-only result.
+
+    Records the first h1, the value following the stock number label, the price,
+    inc-VAT and MOQ headings, and the price-break rows, recognising the same hooks
+    as the full extractor's selectors. Like the full extractor, pricing hooks only
+    count inside the first product container (data-testid="pdp"), so prices in
+    recommendations or sidebars are ignored. No tree is built, and `done` is set
+    as soon as everything has been seen so feeding can stop early.
+    """
+
+    # data-testid, data-qa and class hooks for each field, mirroring the full extractor's selectors
+    _TEST_ID_KEYS = {
+        "exc-vat": "price",
+        "inc-vat": "inc-vat",
+        "price-heading": "moq",
+        "minimum-order-quantity": "moq",
+        "stock-number-desktop": "stock-number-label",
+        "price-breaks": "price-breaks",
+    }
+    _DATA_QA_KEYS = {"unit-price": "price", "moq": "moq"}
+    _CLASS_KEYS = {
+        "price-current": "price",
+        "unit-price": "price",
+        "moq": "moq",
+        "price-breaks": "price-breaks",
+        "quantity-pricing": "price-breaks",
+    }
+    _REQUIRED_KEYS = frozenset({"title", "stock-number", "price", "inc-vat", "moq"})
+    _CONTAINER_KEYS = frozenset({"price", "inc-vat", "moq", "price-breaks"})
+
+    def __init__(self):
+        self.texts: Dict[str, str] = {}
+        self.price_break_rows: List[List[str]] = []
+        self.price_breaks_seen = False
+        self.container_seen = False
+        self.done = False
+        self._key: Optional[str] = None  # what the text being captured is for
+        self._depth = 0  # elements opened inside the captured element
+        self._parts: List[str] = []
+        self._in_price_breaks = False
+        self._break_depth = 0  # elements opened inside the price-break element
+        self._in_container = False
+        self._container_depth = 0  # elements opened inside the product container
+        self._await_stock_number = False
+
+    def _begin(self, key: str) -> None:
+        self._key = key
+        self._depth = 0
+        self._parts = []
+
+    def _hook_keys(self, attrib) -> Iterator[str]:
+        """Yield the fields an element's data-testid, data-qa and class attributes mark it as."""
+        key = self._TEST_ID_KEYS.get(attrib.get("data-testid"))
+        if key:
+            yield key
+        key = self._DATA_QA_KEYS.get(attrib.get("data-qa"))
+        if key:
+            yield key
+        for class_name in attrib.get("class", "").split():
+            key = self._CLASS_KEYS.get(class_name)
+            if key:
+                yield key
+
+    def start(self, tag, attrib):
+        if self._in_container:
+            self._container_depth += 1
+        if self._in_price_breaks:
+            self._break_depth += 1
+
+        if self._key is not None:
+            self._depth += 1
+            return
+
+        if self._await_stock_number:
+            self._await_stock_number = False
+            self._begin("stock-number")
+            return
+
+        if self._in_price_breaks:
+            # Every row under the price-break element, like find_all("tr") on it
+            if tag == "tr":
+                self.price_break_rows.append([])
+            elif tag in ("td", "th") and self.price_break_rows:
+                self._begin("cell")
+            return
+
+        if tag == "h1" and "title" not in self.texts:
+            self._begin("title")
+            return
+
+        if not self.container_seen and attrib.get("data-testid") == "pdp":
+            # The full extractor selects below the container, never the container itself
+            self.container_seen = self._in_container = True
+            self._container_depth = 0
+            return
+
+        # The first element matching any of a field's hooks wins, like select_one on a union selector
+        for key in self._hook_keys(attrib):
+            if key in self._CONTAINER_KEYS and not self._in_container:
+                continue
+            if key == "price-breaks":
+                if not self.price_breaks_seen:
+                    self._in_price_breaks = True
+                    self._break_depth = 0
+                    return
+            elif key == "stock-number-label":
+                if "stock-number" not in self.texts:
+                    self._begin(key)
+                    return
+            elif key not in self.texts:
+                self._begin(key)
+                return
+
+    def data(self, text):
+        if self._key is not None:
+            self._parts.append(text)
+
+    def end(self, tag):
+        if self._key is not None:
+            if self._depth:
+                self._depth -= 1
+            else:
+                # Strip each text piece and join them, like get_text(strip=True)
+                text = "".join(part.strip() for part in self._parts)
+                if self._key == "cell":
+                    self.price_break_rows[-1].append(text)
+                elif self._key == "stock-number-label":
+                    self._await_stock_number = True
+                else:
+                    self.texts[self._key] = text
+                self._key = None
+
+        if self._in_price_breaks:
+            if self._break_depth:
+                self._break_depth -= 1
+            else:
+                self._in_price_breaks = False
+                self.price_breaks_seen = True
+
+        if self._in_container:
+            if self._container_depth:
+                self._container_depth -= 1
+            else:
+                self._in_container = False
+
+        self.done = self.price_breaks_seen and self._REQUIRED_KEYS.issubset(self.texts)
+
+    def close(self):
+        return None
+
+
 class RSComponentsScraper(BaseScraper):
     """
     Scraper for RS Components (rs-online.com) product pages.
@@ -44,22 +326,45 @@ class RSComponentsScraper(BaseScraper):
     availability, and technical details from RS Components product pages.
     """
 
-    def __init__(self, **kwargs):
-        """Initialize RS Components scraper."""
-        super().__init__(
-            vendor_name="RS Components", base_url="https://au.rs-online.com", **kwargs  # Default to AU site
-        )
+    html_strainer = _PRODUCT_STRAINER
 
-    def scrape_product(self, product_url: str) -> ScrapingResult:
+    def __init__(self, locale: str = "au", **kwargs):
+        """
+        Initialize RS Components scraper.
+
+        Args:
+            locale: Regional RS site to scrape (e.g. 'au', 'uk'), which sets the base URL,
+                    currency and local stock wording
+        """
+        if locale not in _LOCALE_CURRENCIES:
+            raise ValueError(f"Unsupported RS Components locale: {locale}")
+
+        super().__init__(vendor_name="RS Components", base_url=f"https://{locale}.rs-online.com", **kwargs)
+        self.locale = locale
+        self._currency = _LOCALE_CURRENCIES[locale]
+        self._availability_re = re.compile(_AVAILABILITY_PATTERN.format(locale=locale), re.IGNORECASE)
+        # Root-relative links resolve to scheme://host + path; precompute the prefix once
+        base = urlparse(self.base_url)
+        self._base_prefix = f"{base.scheme}://{base.netloc}"
+
+    def scrape_product(
+        self, product_url: str, force_refresh: bool = False, fields: Optional[Set[str]] = None
+    ) -> ScrapingResult:
         """
         Scrape product information from RS Components product page.
 
         Args:
             product_url: URL of the RS Components product page
+            force_refresh: Fetch the page from the network even if a cached copy exists
+            fields: Sections of PRODUCT_FIELDS to extract (all of them if None)
 
         Returns:
             ScrapingResult with product information or error details
+
+        Raises:
+            ValueError: If fields names a section outside PRODUCT_FIELDS
         """
+        _check_fields(fields)
         start_time = time.time()
 
         try:
@@ -67,15 +372,29 @@ class RSComponentsScraper(BaseScraper):
             if not self.validate_url(product_url):
                 return ScrapingResult(success=False, error_message=f"URL does not belong to {self.vendor_name}")
 
-            # Make request
-            response = self._make_request(product_url)
+            # Make request, bypassing the response cache if asked to
+            request_kwargs = {"force_refresh": True} if force_refresh and self.response_cache_enabled else {}
+            response = self._make_request(product_url, **request_kwargs)
             response_time = (time.time() - start_time) * 1000
 
-            # Parse HTML
-            soup = self._parse_html(response.text)
+            product_info = None
+            if fields == {"pricing"}:
+                # Price monitors: stream just the pricing markup instead of building a tree
+                # requests assumes ISO-8859-1 when the header names no charset, so only pass a declared one
+                declared = "charset=" in response.headers.get("Content-Type", "").lower()
+                product_info = self._extract_pricing_info(
+                    response.content, product_url, encoding=response.encoding if declared else None
+                )
+
+            if product_info is None:
+                # Parse the raw bytes; lxml detects the encoding itself, skipping the str decode
+                soup = self._parse_html(response.content)
 
-            # Extract product information
-            product_info = self.extract_product_info(soup, product_url)
+                # Extract product information, reading the gallery image straight from the raw page
+                media = None
+                if fields is None or "media" in fields:
+                    media = self._extract_media_from_html(response.content, product_url)
+                product_info = self.extract_product_info(soup, product_url, media=media, fields=fields)
 
             return ScrapingResult(
                 success=True,
@@ -90,35 +409,71 @@ class RSComponentsScraper(BaseScraper):
                 success=False, error_message=str(e), response_time_ms=(time.time() - start_time) * 1000
             )
 
-    def extract_product_info(self, soup: BeautifulSoup, url: str) -> ProductInfo:
+    def extract_product_info(
+        self,
+        soup: BeautifulSoup,
+        url: str,
+        media: Optional[ProductMedia] = None,
+        fields: Optional[Set[str]] = None,
+    ) -> ProductInfo:
         """
         Extract product information from parsed HTML.
 
+        Title and part numbers are always extracted. Sections left out of fields
+        are skipped and keep their empty defaults, which saves price monitors
+        from walking the specification and media markup.
+
         Args:
             soup: BeautifulSoup object of the product page
             url: Original URL of the product page
+            media: Media already read from the raw page, if any
+            fields: Sections of PRODUCT_FIELDS to extract (all of them if None)
 
         Returns:
             ProductInfo object with extracted data
+
+        Raises:
+            ValueError: If fields names a section outside PRODUCT_FIELDS
         """
+        _check_fields(fields)
+        if fields is None:
+            fields = PRODUCT_FIELDS
+
+        test_ids = self._index_test_ids(soup)
+
         # Extract basic product information
-        title = self._extract_title(soup)
+        title = self._extract_title(soup, test_ids)
 
-        vendor_part_number = self._extract_text_safe(
-            soup.select_one('[data-testid="stock-number-desktop"]').next_sibling
-        )
+        # Label values are the next element after each <dt>, skipping any whitespace between them
+        vendor_part_number = self._extract_text_safe(test_ids["stock-number-desktop"].find_next_sibling())
+
+        # Price, stock and gallery all live in the main product container, so search
+        # that subtree instead of the whole page (navigation, footer, recommendations)
+        product_container = test_ids.get("pdp") or _PRODUCT_CONTAINER_SELECTOR.select_one(soup) or soup
 
         # Extract specifications
-        specifications = self._extract_specifications(soup)
+        if "specifications" in fields:
+            specifications = self._extract_specifications(soup, test_ids, stock_number=vendor_part_number)
+        else:
+            specifications = ProductSpecifications()
 
         # Extract pricing
-        pricing = self._extract_pricing(soup)
+        if "pricing" in fields:
+            pricing = self._extract_pricing(product_container)
+        else:
+            pricing = ProductPricing(currency=self._currency)
 
         # Extract availability
-        availability = self._extract_availability(soup)
+        if "availability" in fields:
+            availability = self._extract_availability(product_container)
+        else:
+            availability = ProductAvailability()
 
         # Extract media
-        media = self._extract_media(soup, url)
+        if "media" not in fields:
+            media = ProductMedia()
+        elif media is None:
+            media = self._extract_media(product_container, url)
 
         return ProductInfo(
             vendor_name=self.vendor_name,
@@ -143,85 +498,42 @@ class RSComponentsScraper(BaseScraper):
             True if URL is valid for RS Components
         """
         try:
-            from urllib.parse import urlparse
-
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-
-            # Remove www. prefix if present
-            if domain.startswith("www."):
-                domain = domain[4:]
-
-            # List of RS Components domains
-            rs_domains = [
-                "rs-online.com",
-                "uk.rs-online.com",
-                "au.rs-online.com",
-                "sg.rs-online.com",
-                "export.rs-online.com",
-                "ie.rs-online.com",
-                "fr.rs-online.com",
-                "de.rs-online.com",
-            ]
+            match = _RE_HOST.match(url)
+            if match:
+                return match.group(1).lower() in _RS_DOMAINS
 
-            return domain in rs_domains
+            # Other schemes and malformed URLs take the slower general parse
+            domain = urlparse(url).netloc.lower().removeprefix("www.")
+            return domain in _RS_DOMAINS
 
         except Exception:
             return False
 
-    def _extract_title(self, soup: BeautifulSoup) -> str:
+    def _extract_title(self, soup: BeautifulSoup, test_ids: Optional[Dict[str, Tag]] = None) -> str:
         """Extract product title."""
-        # Try multiple selectors for the title
-        selectors = [
-            "h1",
-            '[data-testid="long-description"]',
-        ]
-
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                return self._extract_text_safe(element).strip()
+        # The h1 takes precedence; the long description, which every page has too, is only a fallback
+        element = soup.find("h1")
+        if element is None:
+            if test_ids is None:
+                element = soup.find(attrs={"data-testid": "long-description"})
+            else:
+                element = test_ids.get("long-description")
+        if element:
+            return self._extract_text_safe(element)
 
         return "Unknown Product"
 
-    def _extract_part_number(self, soup: BeautifulSoup) -> str:
-        """Extract RS part number."""
-        # Look for manufacturer part number (Mfr. Part No.)
-        selectors = [
-            '[data-testid="manufacturer-part-number"]',
-            ".mpn",
-            '[data-qa="manufacturer-part-number"]',
-            'span:-soup-contains("Mfr. Part No.")',
-        ]
-
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                text = self._extract_text_safe(element)
-                # Extract part number after "Mfr. Part No.:"
-                match = re.search(r"Mfr\. Part No\.:\s*([^\s]+)", text)
-                if match:
-                    return match.group(1)
-                # Fallback: if text is just the part number
-                if text and "Mfr. Part No." not in text:
-                    return text.strip()
-
-        # Fallback: try to extract from specifications table
-        specs_table = soup.select_one('.specifications-table, .tech-specs, [data-testid="specifications"]')
-        if specs_table:
-            for row in specs_table.find_all("tr"):
-                cells = row.find_all(["td", "th"])
-                if len(cells) >= 2:
-                    key = self._extract_text_safe(cells[0]).strip().lower()
-                    if "mfr. part no" in key or "manufacturer part number" in key:
-                        value = self._extract_text_safe(cells[1]).strip()
-                        if value:
-                            return value
-
-        return "Unknown"
-
-    def _extract_specifications(self, soup: BeautifulSoup) -> ProductSpecifications:
-        """Extract product specifications."""
+    def _index_test_ids(self, soup: BeautifulSoup) -> Dict[str, Tag]:
+        """Map data-testid values to elements in a single tree walk (first element wins, like select_one)."""
+        test_ids: Dict[str, Tag] = {}
+        for element in soup.find_all(attrs={"data-testid": True}):
+            test_ids.setdefault(element["data-testid"], element)
+        return test_ids
+
+    def _extract_specifications(
+        self, soup: BeautifulSoup, test_ids: Dict[str, Tag], stock_number: Optional[str] = None
+    ) -> ProductSpecifications:
+        """Extract product specifications, reusing the RS stock number if the caller already read it."""
         specs = ProductSpecifications()
 
         # Extract manufacturer
@@ -232,56 +544,79 @@ class RSComponentsScraper(BaseScraper):
         #     if element:
         #         specs.manufacturer = self._extract_text_safe(element)
         #         break
-        brand = soup.select_one('[data-testid="brand-desktop"]')
+        brand = test_ids.get("brand-desktop")
         if brand:
-            specs.manufacturer = self._extract_text_safe(brand.next_sibling)
+            specs.manufacturer = self._extract_text_safe(brand.find_next_sibling())
             if specs.manufacturer == "RS PRO":
-                specs.manufacturer_part_number = self._extract_text_safe(
-                    soup.select_one('[data-testid="stock-number-desktop"]').next_sibling
-                )
+                # RS's own brand uses the stock number as its part number
+                if stock_number is None:
+                    stock_number = self._extract_text_safe(test_ids["stock-number-desktop"].find_next_sibling())
+                specs.manufacturer_part_number = stock_number
             else:
-                specs.manufacturer_part_number = self._extract_text_safe(
-                    soup.select_one('[data-testid="mpn-desktop"]').next_sibling
-                )
-        specs.description = self._extract_text_safe(soup.select_one('[data-testid="long-description"]'))
+                specs.manufacturer_part_number = self._extract_text_safe(test_ids["mpn-desktop"].find_next_sibling())
+        specs.description = self._extract_text_safe(test_ids.get("long-description"))
 
         # Extract category
-        breadcrumb = soup.select_one('[data-testid="breadcrumb-container"]')
+        breadcrumb = test_ids.get("breadcrumb-container")
         if breadcrumb:
-            breadcrumb_items = breadcrumb.find_all("a")
-            if len(breadcrumb_items) > 1:
-                specs.category = self._extract_text_safe(breadcrumb_items[-2])
-                specs.subcategory = self._extract_text_safe(breadcrumb_items[-1])
-            else:
-                specs.category = self._extract_text_safe(breadcrumb_items[0])
+            # Only the last two links matter, so track them instead of collecting every link
+            previous_link = last_link = None
+            for node in breadcrumb.descendants:
+                if node.name == "a":
+                    previous_link, last_link = last_link, node
+            if previous_link is not None:
+                specs.category = self._extract_text_safe(previous_link)
+                specs.subcategory = self._extract_text_safe(last_link)
+            elif last_link is not None:
+                specs.category = self._extract_text_safe(last_link)
         else:
             specs.category = "Unknown"
 
         # Extract technical specifications table
-        specs_table = soup.select_one('[data-testid="product-content"]')
+        specs_table = test_ids.get("product-content")
         if specs_table:
             specs.technical_specs = self._parse_specifications_table(specs_table)
 
-        # Extract datasheet URL
-        links = soup.select('[data-testid="product-content"] a')
-        for link in links:
-            if "datasheet" in link.get_text(strip=True).lower():
-                datasheet_url = link.get("href")
-                if datasheet_url:
-                    if datasheet_url.startswith("//"):
-                        datasheet_url = "https:" + datasheet_url
-                    elif datasheet_url.startswith("/"):
-                        datasheet_url = urljoin(self.base_url, datasheet_url)
-                    specs.datasheet_url = datasheet_url
-                    break
-
-        long_content = soup.select_one('[data-testid="descriptive-content-container"]')
+            # Extract datasheet URL from the links in the same container. Datasheet links
+            # name the file in their href or title, so match on the attributes first and
+            # only read and lowercase every link's text if that finds nothing.
+            link = _DATASHEET_LINK_SELECTOR.select_one(specs_table)
+            if link is None:
+                links = specs_table.find_all("a", href=True)
+                link = next((a for a in links if "datasheet" in a.get_text(strip=True).lower()), None)
+            datasheet_url = link.get("href") if link else None
+            if datasheet_url:
+                if datasheet_url.startswith("//"):
+                    datasheet_url = "https:" + datasheet_url
+                elif datasheet_url.startswith("/"):
+                    datasheet_url = self._base_prefix + datasheet_url
+                specs.datasheet_url = datasheet_url
+
+        long_content = test_ids.get("descriptive-content-container")
         if long_content:
-            # long_content is a div containing headings (H3) followed by a div with text
-            markdown_content = ""
-            for section in long_content.find_all("h3"):
-                section_title = self._extract_text_safe(section)
-                section_content = section.find_next_sibling("div")
+            # long_content is a div containing headings (H3) followed by a div with text.
+            # Headings may sit under different parents (e.g. one <section> each), so walk
+            # each parent's children once, pairing every H3 with the next div after it.
+            headings = long_content.find_all("h3")
+            section_divs = {}  # id(heading) -> its content div
+            walked_parents = set()
+            for heading in headings:
+                parent = heading.parent
+                if id(parent) in walked_parents:
+                    continue
+                walked_parents.add(id(parent))
+                pending = []
+                for node in parent.children:
+                    if node.name == "h3":
+                        pending.append(node)
+                    elif node.name == "div" and pending:
+                        for pending_heading in pending:
+                            section_divs[id(pending_heading)] = node
+                        pending = []
+
+            markdown_parts = []
+            for heading in headings:
+                section_content = section_divs.get(id(heading))
                 if section_content:
                     list_items = section_content.find_all("li")
                     if list_items:
@@ -289,110 +624,137 @@ class RSComponentsScraper(BaseScraper):
                     else:
                         content_text = self._extract_text_safe(section_content).replace("•", "\n -").strip()
                     if content_text:
-                        markdown_content += f"### {section_title}\n\n{content_text}\n\n"
-            specs.detailed_description = markdown_content.strip()
+                        section_title = self._extract_text_safe(heading)
+                        markdown_parts.append(f"### {section_title}\n\n{content_text}\n\n")
+            specs.detailed_description = "".join(markdown_parts).strip()
 
         return specs
 
     def _extract_pricing(self, soup: BeautifulSoup) -> ProductPricing:
         """Extract pricing information."""
-        pricing = ProductPricing(currency="AUD")
+        break_rows = []
+        price_breaks_table = _PRICE_BREAKS_SELECTOR.select_one(soup)
+        if price_breaks_table:
+            for row in price_breaks_table.find_all("tr"):
+                break_rows.append([self._extract_text_safe(cell) for cell in row.find_all(["td", "th"], limit=2)])
+
+        return self._build_pricing(
+            price_text=self._extract_text_safe(_PRICE_SELECTOR.select_one(soup)),
+            inc_vat_text=self._extract_text_safe(_INC_VAT_SELECTOR.select_one(soup)),
+            break_rows=break_rows,
+            moq_text=self._extract_text_safe(_MOQ_SELECTOR.select_one(soup)),
+        )
+
+    def _build_pricing(
+        self, price_text: str, inc_vat_text: str, break_rows: List[List[str]], moq_text: str
+    ) -> ProductPricing:
+        """Build pricing from the text of the price fields and price-break table rows."""
+        pricing = ProductPricing(currency=self._currency)
 
         # Extract main price
-        price_selectors = ['[data-testid="exc-vat"]', ".price-current", ".unit-price", '[data-qa="unit-price"]']
-
-        for selector in price_selectors:
-            element = soup.select_one(selector)
-            if element:
-                price_text = self._extract_text_safe(element)
-                price_value = self._extract_number_from_text(price_text)
-                if price_value:
-                    pricing.package_price = Decimal(str(price_value))
-                break
+        price_value = _parse_decimal(price_text)
+        if price_value:
+            pricing.package_price = price_value
 
-        element = soup.select_one('[data-testid="inc-vat"]')
-        if element:
-            price_text = self._extract_text_safe(element)
-            price_value = self._extract_number_from_text(price_text)
-            if price_value:
-                pricing.package_price_inc_tax = Decimal(str(price_value))
+        price_value = _parse_decimal(inc_vat_text)
+        if price_value:
+            pricing.package_price_inc_tax = price_value
 
         # Extract quantity breaks
         qty_breaks = {}
-        price_breaks_table = soup.select_one('.price-breaks, .quantity-pricing, [data-testid="price-breaks"]')
-
-        if price_breaks_table:
-            rows = price_breaks_table.find_all("tr")[1:]  # Skip header
-            for row in rows:
-                cells = row.find_all(["td", "th"])
-                if len(cells) >= 2:
-                    qty_text = self._extract_text_safe(cells[0])
-                    price_text = self._extract_text_safe(cells[1])
-
-                    qty = self._extract_number_from_text(qty_text)
-                    price = self._extract_number_from_text(price_text)
+        for cells in break_rows[1:]:  # Skip header
+            if len(cells) >= 2:
+                qty = _parse_decimal(cells[0])
+                price = _parse_decimal(cells[1])
 
-                    if qty and price:
-                        qty_breaks[int(qty)] = Decimal(str(price))
+                if qty and price:
+                    qty_breaks[int(qty)] = price
 
         pricing.quantity_breaks = qty_breaks
 
         # Extract MOQ
-        moq_selectors = [
-            '[data-testid="price-heading"]',
-            '[data-testid="minimum-order-quantity"]',
-            ".moq",
-            '[data-qa="moq"]',
-        ]
-
-        for selector in moq_selectors:
-            element = soup.select_one(selector)
-            if element:
-                moq_text = self._extract_text_safe(element)
-                moq_value = self._extract_number_from_text(moq_text)
-                if moq_value:
-                    pricing.minimum_order_quantity = int(moq_value)
-                break
+        moq_value = _parse_decimal(moq_text)
+        if moq_value:
+            pricing.minimum_order_quantity = int(moq_value)
 
         return pricing
 
+    def _extract_pricing_info(self, html: bytes, url: str, encoding: Optional[str] = None) -> Optional[ProductInfo]:
+        """
+        Build a pricing-only ProductInfo by streaming the raw page through lxml.
+
+        Stops feeding the parser once the price fields and price-break table have
+        been read. Returns None when the page lacks the title, stock number, price
+        or price-break hooks, or the data-testid="pdp" container the price hooks
+        are read from, so the caller can fall back to full extraction.
+
+        Args:
+            html: Raw page bytes
+            url: Original URL of the product page
+            encoding: Charset declared by the response, if any. Without one the page
+                      is sniffed the same way BeautifulSoup does, since libxml2 would
+                      otherwise read a page lacking <meta charset> as Latin-1.
+        """
+        if encoding is None:
+            encoding = UnicodeDammit(html, is_html=True).original_encoding
+
+        target = _PricingTarget()
+        parser = etree.HTMLParser(target=target, encoding=encoding)
+        for offset in range(0, len(html), _PRICING_CHUNK_SIZE):
+            parser.feed(html[offset : offset + _PRICING_CHUNK_SIZE])
+            if target.done:
+                break
+        else:
+            parser.close()
+
+        texts = target.texts
+        if not target.price_breaks_seen or not all(texts.get(key) for key in ("title", "stock-number", "price")):
+            return None
+
+        pricing = self._build_pricing(
+            price_text=texts["price"],
+            inc_vat_text=texts.get("inc-vat", ""),
+            break_rows=target.price_break_rows,
+            moq_text=texts.get("moq", ""),
+        )
+        return ProductInfo(
+            vendor_name=self.vendor_name,
+            vendor_part_number=texts["stock-number"],
+            product_url=url,
+            title=texts["title"],
+            pricing=pricing,
+            scraper_version="1.0",
+        )
+
     def _extract_availability(self, soup: BeautifulSoup) -> ProductAvailability:
         """Extract availability information."""
         availability = ProductAvailability()
 
         # Check stock status
-        stock_selectors = [
-            '[data-testid="stock-status"]',
-            '[data-testid="stock-status-0"]',
-            '[data-testid="stock-status-1"]',
-            ".stock-status",
-            '[data-qa="availability"]',
-        ]
-
-        for selector in stock_selectors:
-            element = soup.select_one(selector)
-            if element:
-                stock_text = self._extract_text_safe(element).lower()
-                if "in au stock" in stock_text:
-                    availability.in_stock = True
-                    availability.lead_time_description = stock_text
-                    availability.lead_time_days = 0  # Assume immediate availability
-                    qty_match = re.search(r"(\d+)\s*in\s*au\s*stock", stock_text)
-                    if qty_match:
-                        availability.stock_quantity = int(qty_match.group(1))
-                elif "in global stock" in stock_text:
-                    availability.in_stock = True
-                    availability.lead_time_description = stock_text
-                    qty_match = re.search(r"(\d+)\s*(?:in global stock|in au stock)", stock_text)
-                    if qty_match:
-                        availability.stock_quantity = int(qty_match.group(1))
-                    availability.lead_time_description = stock_text
-
-                    # Extract days from text like "5-7 working days"
-                    days_match = re.search(r"(\d+)(?:-\d+)?\s*(?:working\s*)?day(s)?", stock_text)
-                    if days_match:
-                        availability.lead_time_days = int(days_match.group(1))
-                    break
+        for element in _STOCK_SELECTOR.iselect(soup):
+            stock_text = self._extract_text_safe(element)
+            # One case-insensitive pass finds the stock location, quantity and lead time
+            stock_match = days_match = None
+            for match in self._availability_re.finditer(stock_text):
+                if match.group("where"):
+                    stock_match = stock_match or match
+                elif days_match is None:
+                    days_match = match
+            if not stock_match:
+                continue
+
+            availability.in_stock = True
+            availability.lead_time_description = stock_text.lower()
+            if stock_match.group("qty"):
+                availability.stock_quantity = int(stock_match.group("qty"))
+
+            if stock_match.group("where").lower() == self.locale:
+                availability.lead_time_days = 0  # Local stock, assume immediate availability
+            else:
+                # Days from text like "5-7 working days"
+                if days_match:
+                    availability.lead_time_days = int(days_match.group("days"))
+                break
 
         return availability
 
@@ -401,39 +763,65 @@ class RSComponentsScraper(BaseScraper):
         media = ProductMedia()
 
         # Extract primary image
-        img_selectors = [
-            '[data-testid="gallery-fallback-image"]',
-            ".product-image img",
-            ".pdp-image img",
-            ".hero-image img",
-        ]
-
-        for selector in img_selectors:
-            element = soup.select_one(selector)
-            if element and element.get("src"):
-                img_url = str(element["src"])
-                if img_url.startswith("//"):
-                    img_url = "https:" + img_url
-                elif img_url.startswith("/"):
-                    img_url = urljoin(base_url, img_url)
-
-                media.primary_image_url = img_url
-                media.additional_images.extend(str(element["srcset"]).split(", "))
+        for element in _IMAGE_SELECTOR.iselect(soup):
+            if element.get("src"):
+                media.primary_image_url = self._absolute_image_url(str(element["src"]), base_url)
+                media.additional_images.extend(_split_srcset(element.get("srcset", "")))
                 break
 
         return media
 
+    def _extract_media_from_html(self, html: bytes, base_url: str) -> Optional[ProductMedia]:
+        """
+        Extract the gallery image from the raw page without searching the parsed tree.
+
+        Only the page from the data-testid="pdp" container onwards is searched. Returns
+        None when there is no such container, or when the gallery image tag isn't found
+        after it with both src and srcset, leaving the caller to fall back to _extract_media.
+        """
+        container = _PDP_TAG_RE.search(html)
+        if not container:
+            return None
+
+        tag = _GALLERY_IMG_TAG_RE.search(html, container.end())
+        if not tag:
+            return None
+
+        src = _IMG_SRC_RE.search(tag.group())
+        srcset = _IMG_SRCSET_RE.search(tag.group())
+        if not (src and srcset):
+            return None
+
+        media = ProductMedia()
+        img_url = unescape(src.group(1).decode("utf-8", "replace"))
+        media.primary_image_url = self._absolute_image_url(img_url, base_url)
+        media.additional_images.extend(_split_srcset(unescape(srcset.group(1).decode("utf-8", "replace"))))
+        return media
+
+    def _absolute_image_url(self, img_url: str, base_url: str) -> str:
+        """Resolve protocol-relative and root-relative image URLs."""
+        if img_url.startswith("//"):
+            return "https:" + img_url
+        elif img_url.startswith("/"):
+            # Product URLs are normally on the scraper's own site, so skip urljoin's reparse
+            if base_url.startswith(self._base_prefix + "/"):
+                return self._base_prefix + img_url
+            return urljoin(base_url, img_url)
+        return img_url
+
     def _parse_specifications_table(self, table_element) -> Dict[str, Any]:
         """Parse technical specifications table."""
         specs = {}
 
-        items = table_element.find_all("p")
-        for i in range(0, len(items), 2):
-            if i + 1 < len(items):
-                key = self._extract_text_safe(items[i]).strip()
-                value = self._extract_text_safe(items[i + 1]).strip()
-                if key and value:
-                    specs[key] = value
+        # Paragraphs alternate key, value; zipping one iterator with itself yields the pairs
+        # (an unpaired trailing paragraph is dropped)
+        items = iter(table_element.find_all("p"))
+        for key_element, value_element in zip(items, items):
+            key = self._extract_text_safe(key_element)
+            value = self._extract_text_safe(value_element)
+            if key and value:
+                # The same few dozen spec names recur on every product; share one copy
+                specs[sys.intern(key)] = value
 
         return specs
 
@@ -455,10 +843,11 @@ if __name__ == "__main__":
         r"https://au.mouser.com/ProductDetail/TE-Connectivity-DEUTSCH/W2-P?qs=kRS0rR9cfpVDqz7qI6fFMg%3D%3D",
         r"https://au.rs-online.com/web/p/hook-up-wire/2081069",
     ]
-    for test_no, product_url in enumerate(product_urls):
+    # Fetch all pages concurrently over the scraper's shared session
+    results = scraper.scrape_multiple_products(product_urls, max_workers=8)
+    for test_no, (product_url, result) in enumerate(zip(product_urls, results)):
         print(f"Scraping product: {product_url}")
         print(f"Notes: {notes[test_no]}")
-        result = scraper.scrape_product(product_url)
 
         if result.success:
             print("Product scraped successfully:")
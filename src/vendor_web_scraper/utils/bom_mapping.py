@@ -6,30 +6,16 @@ to InvenTree-compatible format based on scraped product information.
 """
 
 import json
-from typing import Dict, Any, Optional, Callable
+import logging
+from typing import Dict, Any, List, Optional, Callable
 
+# Compact separators keep json on its C encoder; indent forces the pure-Python one
+_JSON_ENCODE = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
 
-def create_bom_mapping_dict() -> Dict[str, Callable]:
-    """
-    Create a dictionary with BOM headers as keys and BOM header functions as values.
+logger = logging.getLogger(__name__)
 
-    The functions take a ProductInfo object and return the appropriate value
-    for the corresponding InvenTree field.
-
-    Returns:
-        Dictionary mapping BOM field names to extraction functions
-    """
-
-
-"""
-BOM to InvenTree mapping utilities.
-
-This module provides mapping functions for converting BOM data
-to InvenTree-compatible format based on scraped product information.
-"""
-
-import json
-from typing import Dict, Any, Optional, Callable
+# Technical spec names (lowercased) that are also useful as keywords
+_KEYWORD_KEYS = frozenset({"type", "series", "material", "colour", "color"})
 
 
 def create_bom_mapping_dict() -> Dict[str, Callable]:
@@ -49,15 +35,13 @@ def create_bom_mapping_dict() -> Dict[str, Callable]:
 
         Uses the first few words of the title/description or manufacturer part number.
         """
-        if not product or not hasattr(product, "specifications"):
+        if not product:
             return "Unknown Product"
 
         # Try manufacturer part number first (often shorter)
-        if (
-            hasattr(product.specifications, "manufacturer_part_number")
-            and product.specifications.manufacturer_part_number
-        ):
-            return product.specifications.manufacturer_part_number
+        manufacturer_part_number = getattr(getattr(product, "specifications", None), "manufacturer_part_number", None)
+        if manufacturer_part_number:
+            return manufacturer_part_number
 
         # Use first few words of title/description
         title = getattr(product, "title", "") or ""
@@ -72,50 +56,46 @@ def create_bom_mapping_dict() -> Dict[str, Callable]:
             return ""
 
         # Use specifications description first, fallback to title
-        if hasattr(product, "specifications") and product.specifications:
-            if hasattr(product.specifications, "description") and product.specifications.description:
-                return product.specifications.description
-        return getattr(product, "title", "") or ""
+        description = getattr(getattr(product, "specifications", None), "description", None)
+        return description or getattr(product, "title", "") or ""
 
     def extract_brand(product: Any) -> str:
         """Extract manufacturer/brand name."""
-        if not product or not hasattr(product, "specifications"):
-            return ""
-        return getattr(product.specifications, "manufacturer", "") or ""
+        return getattr(getattr(product, "specifications", None), "manufacturer", "") or ""
 
     def extract_remote_image(product: Any) -> str:
         """Extract product image URL."""
-        if not product or not hasattr(product, "media"):
-            return ""
-        return getattr(product.media, "primary_image_url", "") or ""
+        return getattr(getattr(product, "media", None), "primary_image_url", "") or ""
 
     def extract_keywords(product: Any) -> str:
         """Extract keywords (categories) as comma-separated string."""
-        if not product or not hasattr(product, "specifications"):
+        specs = getattr(product, "specifications", None)
+        if not product or specs is None:
             return ""
 
         keywords = []
 
         # Add category if available
-        if hasattr(product.specifications, "category") and product.specifications.category:
-            keywords.append(product.specifications.category)
+        category = getattr(specs, "category", None)
+        if category:
+            keywords.append(category)
 
         # Add manufacturer if available
-        if hasattr(product.specifications, "manufacturer") and product.specifications.manufacturer:
-            keywords.append(product.specifications.manufacturer)
+        manufacturer = getattr(specs, "manufacturer", None)
+        if manufacturer:
+            keywords.append(manufacturer)
 
         # Add key technical specs as keywords
-        if hasattr(product.specifications, "technical_specs") and product.specifications.technical_specs:
-            for key, value in product.specifications.technical_specs.items():
-                if key.lower() in ["type", "series", "material", "colour", "color"]:
-                    keywords.append(f"{key}: {value}")
+        technical_specs = getattr(specs, "technical_specs", None)
+        if technical_specs:
+            keywords.extend(
+                f"{key}: {value}" for key, value in technical_specs.items() if key.lower() in _KEYWORD_KEYS
+            )
 
         return ", ".join(keywords)
 
     def extract_link(product: Any) -> str:
         """Extract product URL."""
-        if not product:
-            return ""
         return getattr(product, "product_url", "") or ""
 
     def extract_units(product: Any) -> int:
@@ -124,50 +104,40 @@ def create_bom_mapping_dict() -> Dict[str, Callable]:
 
         This looks for pack quantities or minimum order quantities.
         """
-        if not product or not hasattr(product, "pricing"):
-            return 1
-
-        # Check for minimum order quantity
-        if hasattr(product.pricing, "minimum_order_quantity") and product.pricing.minimum_order_quantity:
-            return product.pricing.minimum_order_quantity
-
-        # Default to 1 for individual components
-        return 1
+        # Use the minimum order quantity, defaulting to 1 for individual components
+        return getattr(getattr(product, "pricing", None), "minimum_order_quantity", None) or 1
 
     def extract_pricing_updated(product: Any) -> str:
         """Extract current price with currency."""
-        if not product or not hasattr(product, "pricing"):
-            return ""
-
-        if hasattr(product.pricing, "unit_price") and product.pricing.unit_price:
-            currency = getattr(product.pricing, "currency", "USD") or "USD"
-            return f"{currency} {product.pricing.unit_price}"
+        pricing = getattr(product, "pricing", None)
+        unit_price = getattr(pricing, "unit_price", None)
+        if unit_price:
+            currency = getattr(pricing, "currency", "USD") or "USD"
+            return currency + " " + str(unit_price)
 
         return ""
 
     def extract_in_stock(product: Any) -> bool:
         """Extract stock availability status."""
-        if not product or not hasattr(product, "availability"):
-            return False
-        return getattr(product.availability, "in_stock", False) or False
+        return getattr(getattr(product, "availability", None), "in_stock", False) or False
 
     def extract_lead_time(product: Any) -> Optional[str]:
         """Extract lead time information."""
-        if not product or not hasattr(product, "availability"):
-            return None
+        availability = getattr(product, "availability", None)
+
+        lead_time_description = getattr(availability, "lead_time_description", None)
+        if lead_time_description:
+            return lead_time_description
 
-        if hasattr(product.availability, "lead_time_description") and product.availability.lead_time_description:
-            return product.availability.lead_time_description
-        elif hasattr(product.availability, "lead_time_days") and product.availability.lead_time_days:
-            return f"{product.availability.lead_time_days} days"
+        lead_time_days = getattr(availability, "lead_time_days", None)
+        if lead_time_days:
+            return str(lead_time_days) + " days"
 
         return None
 
     def extract_external_stock(product: Any) -> Optional[int]:
         """Extract available stock quantity."""
-        if not product or not hasattr(product, "availability"):
-            return None
-        return getattr(product.availability, "stock_quantity", None)
+        return getattr(getattr(product, "availability", None), "stock_quantity", None)
 
     def extract_parameters(product: Any) -> str:
         """
@@ -175,46 +145,53 @@ def create_bom_mapping_dict() -> Dict[str, Callable]:
 
         This includes all technical specifications in a structured format.
         """
-        if not product or not hasattr(product, "specifications"):
+        specs = getattr(product, "specifications", None)
+        pricing = getattr(product, "pricing", None)
+        availability = getattr(product, "availability", None)
+        if not (specs or pricing or availability):
+            # Nothing to report, e.g. a page that failed to parse
             return "{}"
 
         parameters = {}
 
         # Add basic product info
-        if hasattr(product.specifications, "manufacturer") and product.specifications.manufacturer:
-            parameters["Brand"] = product.specifications.manufacturer
+        manufacturer = getattr(specs, "manufacturer", None)
+        if manufacturer:
+            parameters["Brand"] = manufacturer
 
-        if (
-            hasattr(product.specifications, "manufacturer_part_number")
-            and product.specifications.manufacturer_part_number
-        ):
-            parameters["Manufacturer Part Number"] = product.specifications.manufacturer_part_number
+        manufacturer_part_number = getattr(specs, "manufacturer_part_number", None)
+        if manufacturer_part_number:
+            parameters["Manufacturer Part Number"] = manufacturer_part_number
 
-        if hasattr(product.specifications, "category") and product.specifications.category:
-            parameters["Category"] = product.specifications.category
+        category = getattr(specs, "category", None)
+        if category:
+            parameters["Category"] = category
 
         # Add technical specifications
-        if hasattr(product.specifications, "technical_specs") and product.specifications.technical_specs:
-            parameters.update(product.specifications.technical_specs)
+        technical_specs = getattr(specs, "technical_specs", None)
+        if technical_specs:
+            parameters.update(technical_specs)
 
         # Add pricing info if available
-        if hasattr(product, "pricing") and product.pricing:
-            if hasattr(product.pricing, "unit_price") and product.pricing.unit_price:
-                currency = getattr(product.pricing, "currency", "USD") or "USD"
-                parameters["Unit Price"] = f"{currency} {product.pricing.unit_price}"
+        unit_price = getattr(pricing, "unit_price", None)
+        if unit_price:
+            currency = getattr(pricing, "currency", "USD") or "USD"
+            parameters["Unit Price"] = currency + " " + str(unit_price)
 
-            if hasattr(product.pricing, "minimum_order_quantity") and product.pricing.minimum_order_quantity:
-                parameters["Minimum Order Quantity"] = product.pricing.minimum_order_quantity
+        minimum_order_quantity = getattr(pricing, "minimum_order_quantity", None)
+        if minimum_order_quantity:
+            parameters["Minimum Order Quantity"] = minimum_order_quantity
 
         # Add availability info
-        if hasattr(product, "availability") and product.availability:
-            if hasattr(product.availability, "stock_quantity") and product.availability.stock_quantity:
-                parameters["Stock Quantity"] = product.availability.stock_quantity
+        stock_quantity = getattr(availability, "stock_quantity", None)
+        if stock_quantity:
+            parameters["Stock Quantity"] = stock_quantity
 
-            if hasattr(product.availability, "lead_time_description") and product.availability.lead_time_description:
-                parameters["Lead Time"] = product.availability.lead_time_description
+        lead_time_description = getattr(availability, "lead_time_description", None)
+        if lead_time_description:
+            parameters["Lead Time"] = lead_time_description
 
-        return json.dumps(parameters, indent=2)
+        return _JSON_ENCODE(parameters)
 
     # Return the mapping dictionary
     return {
@@ -233,6 +210,11 @@ def create_bom_mapping_dict() -> Dict[str, Callable]:
     }
 
 
+# Built once at import rather than re-creating the extractor closures for every product
+_BOM_MAPPING = create_bom_mapping_dict()
+_BOM_MAPPING_ITEMS = tuple(_BOM_MAPPING.items())
+
+
 def convert_product_to_bom_row(product: Any) -> Dict[str, Any]:
     """
     Convert a ProductInfo object to a BOM row dictionary.
@@ -243,17 +225,47 @@ def convert_product_to_bom_row(product: Any) -> Dict[str, Any]:
     Returns:
         Dictionary with BOM field names as keys and extracted values
     """
-    mapping = create_bom_mapping_dict()
-    result = {}
+    try:
+        return {field_name: extract_func(product) for field_name, extract_func in _BOM_MAPPING_ITEMS}
+    except Exception:
+        # An extractor failed; redo the row field by field so only that field is lost
+        return {field_name: _extract_field(field_name, product) for field_name, _ in _BOM_MAPPING_ITEMS}
 
-    for field_name, extract_func in mapping.items():
-        try:
-            result[field_name] = extract_func(product)
-        except Exception as e:
-            print(f"Warning: Failed to extract {field_name}: {e}")
-            result[field_name] = None
 
-    return result
+def convert_products_to_bom_rows(products: List[Any]) -> List[Dict[str, Any]]:
+    """
+    Convert several ProductInfo objects to BOM row dictionaries.
+
+    Fills the rows one field at a time, running each extractor over every
+    product before moving on to the next.
+
+    Args:
+        products: ProductInfo objects from scraping
+
+    Returns:
+        List of BOM row dictionaries in the same order as products
+    """
+    rows = [{} for _ in products]
+
+    for field_name, extract_func in _BOM_MAPPING_ITEMS:
+        try:
+            for row, product in zip(rows, products):
+                row[field_name] = extract_func(product)
+        except Exception:
+            # An extractor failed; redo this field product by product so only the failures are lost
+            for row, product in zip(rows, products):
+                row[field_name] = _extract_field(field_name, product)
+
+    return rows
+
+
+def _extract_field(field_name: str, product: Any) -> Any:
+    """Run a single BOM field extractor, returning None if it fails."""
+    try:
+        return _BOM_MAPPING[field_name](product)
+    except Exception as e:
+        logger.warning("Failed to extract %s: %s", field_name, e)
+        return None
 
 
 def create_inventree_excel_row(product: Any) -> Dict[str, Any]:
@@ -268,26 +280,29 @@ def create_inventree_excel_row(product: Any) -> Dict[str, Any]:
     Returns:
         Dictionary ready for Excel export to InvenTree
     """
-    bom_data = convert_product_to_bom_row(product)
+    # Fields used twice are extracted once; the rest go straight into the row
+    name = _extract_field("name", product)
+    description = _extract_field("description", product)
+    keywords = _extract_field("keywords", product)
 
     # Map to InvenTree expected field names
     inventree_row = {
-        "IPN": bom_data.get("name", ""),
-        "Name": bom_data.get("description", ""),
-        "Description": bom_data.get("description", ""),
-        "Category": bom_data.get("keywords", "").split(",")[0] if bom_data.get("keywords") else "",
+        "IPN": name,
+        "Name": description,
+        "Description": description,
+        "Category": keywords.split(",", 1)[0] if keywords else "",
         "Supplier Name": getattr(product, "vendor_name", "") if product else "",
         "SKU": getattr(product, "vendor_part_number", "") if product else "",
-        "MPN": bom_data.get("name", ""),
-        "Manufacturer": bom_data.get("brand", ""),
-        "Link": bom_data.get("link", ""),
-        "Note": bom_data.get("parameters", ""),
-        "Image": bom_data.get("remote_image", ""),
-        "Units": bom_data.get("units", 1),
-        "Price": bom_data.get("pricing_updated", ""),
-        "In Stock": bom_data.get("in_stock", False),
-        "Lead Time": bom_data.get("lead_time", ""),
-        "Stock Quantity": bom_data.get("external_stock", ""),
+        "MPN": name,
+        "Manufacturer": _extract_field("brand", product),
+        "Link": _extract_field("link", product),
+        "Note": _extract_field("parameters", product),
+        "Image": _extract_field("remote_image", product),
+        "Units": _extract_field("units", product),
+        "Price": _extract_field("pricing_updated", product),
+        "In Stock": _extract_field("in_stock", product),
+        "Lead Time": _extract_field("lead_time", product),
+        "Stock Quantity": _extract_field("external_stock", product),
     }
 
     return inventree_row
@@ -5,9 +5,27 @@ Utility functions for the vendor web scraper.
 import re
 import time
 import random
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from urllib.parse import urlparse, urljoin
 
+_WS_RE = re.compile(r"\s+")
+# Anything that isn't a word character, whitespace or common punctuation/currency
+_CLEAN_RE = re.compile(r"[^\w\s\-\.\,\:\;\(\)\[\]\&\%\$\£\€]")
+# The same removal for ASCII text as a translate table, derived from _CLEAN_RE so they can't drift
+_CLEAN_ASCII_TABLE = str.maketrans("", "", "".join(c for c in map(chr, range(128)) if _CLEAN_RE.match(c)))
+_PRICE_RE = re.compile(r"(\d+\.?\d*)")
+# Default currency symbols/codes and thousands separators, stripped in one pass
+_CURRENCY_STRIP = re.compile(r"[£$€¥,]|USD|GBP|EUR|AUD")
+# Patterns like "5 in stock", "Available: 10", etc.
+_QTY_PATTERNS = (
+    re.compile(r"(\d+)\s*(?:in stock|available|pieces?|units?)"),
+    re.compile(r"(?:stock|available|qty):\s*(\d+)"),
+    re.compile(r"(\d+)\s*(?:pcs?|pc|units?)"),
+)
+# At least three part number characters, at least one of them a letter or digit
+_PART_RE = re.compile(r"(?=.*[A-Za-z0-9])[A-Za-z0-9\-_\.]{3,}")
+
 
 def clean_text(text: str) -> str:
     """
@@ -23,13 +41,15 @@ def clean_text(text: str) -> str:
         return ""
 
     # Remove extra whitespace
-    text = re.sub(r"\s+", " ", text)
+    text = _WS_RE.sub(" ", text)
 
     # Remove leading/trailing whitespace
     text = text.strip()
 
-    # Remove common unwanted characters
-    text = re.sub(r"[^\w\s\-\.\,\:\;\(\)\[\]\&\%\$\£\€]", "", text)
+    # Remove common unwanted characters; translate covers ASCII, the regex anything beyond it
+    text = text.translate(_CLEAN_ASCII_TABLE)
+    if not text.isascii():
+        text = _CLEAN_RE.sub("", text)
 
     return text
 
@@ -48,16 +68,23 @@ def extract_price_from_text(text: str, currency_symbols: List[str] = None) -> Op
     if not text:
         return None
 
-    if currency_symbols is None:
-        currency_symbols = ["£", "$", "€", "¥", "USD", "GBP", "EUR", "AUD"]
+    # Pass the symbols on as a tuple so the parse can be cached
+    return _extract_price(text, tuple(currency_symbols) if currency_symbols is not None else None)
+
 
+@lru_cache(maxsize=1024)
+def _extract_price(text: str, currency_symbols: Optional[Tuple[str, ...]]) -> Optional[float]:
+    """Cached body of extract_price_from_text; the same price text recurs across a page's fields."""
     # Remove currency symbols and common separators
-    cleaned = text.replace(",", "")
-    for symbol in currency_symbols:
-        cleaned = cleaned.replace(symbol, "")
+    if currency_symbols is None:
+        cleaned = _CURRENCY_STRIP.sub("", text)
+    else:
+        cleaned = text.replace(",", "")
+        for symbol in currency_symbols:
+            cleaned = cleaned.replace(symbol, "")
 
     # Find decimal number
-    price_match = re.search(r"(\d+\.?\d*)", cleaned)
+    price_match = _PRICE_RE.search(cleaned)
 
     if price_match:
         try:
@@ -68,6 +95,7 @@ def extract_price_from_text(text: str, currency_symbols: List[str] = None) -> Op
     return None
 
 
+@lru_cache(maxsize=1024)
 def extract_quantity_from_text(text: str) -> Optional[int]:
     """
     Extract quantity/stock number from text.
@@ -81,17 +109,10 @@ def extract_quantity_from_text(text: str) -> Optional[int]:
     if not text:
         return None
 
-    # Look for patterns like "5 in stock", "Available: 10", etc.
-    qty_patterns = [
-        r"(\d+)\s*(?:in stock|available|pieces?|units?)",
-        r"(?:stock|available|qty):\s*(\d+)",
-        r"(\d+)\s*(?:pcs?|pc|units?)",
-    ]
-
     text_lower = text.lower()
 
-    for pattern in qty_patterns:
-        match = re.search(pattern, text_lower)
+    for pattern in _QTY_PATTERNS:
+        match = pattern.search(text_lower)
         if match:
             try:
                 return int(match.group(1))
@@ -115,20 +136,21 @@ def normalize_url(url: str, base_url: str = None) -> str:
     if not url:
         return ""
 
+    # Already complete, the usual case
+    if url.startswith(("http://", "https://")):
+        return url
+
     # Handle protocol-relative URLs
     if url.startswith("//"):
         return "https:" + url
 
     # Handle relative URLs
-    if not url.startswith(("http://", "https://")):
-        if base_url:
-            return urljoin(base_url, url)
-        else:
-            return "https://" + url.lstrip("/")
-
-    return url
+    if base_url:
+        return urljoin(base_url, url)
+    return "https://" + url.lstrip("/")
 
 
+@lru_cache(maxsize=1024)
 def get_domain_from_url(url: str) -> str:
     """
     Extract domain from URL.
@@ -139,16 +161,29 @@ def get_domain_from_url(url: str) -> str:
     Returns:
         Domain name
     """
+    if not url:
+        return ""
+
     try:
-        parsed = urlparse(url)
-        domain = parsed.netloc.lower()
+        # Plain http(s) URLs: the domain runs up to the first "/", so slice it out directly
+        if url.startswith("https://"):
+            domain = url[8:].partition("/")[0]
+        elif url.startswith("http://"):
+            domain = url[7:].partition("/")[0]
+        else:
+            domain = None
+
+        # Other schemes, or a query/fragment straight after the host, need the full parse
+        if domain is None or "?" in domain or "#" in domain:
+            domain = urlparse(url).netloc
+        domain = domain.lower()
 
         # Remove www prefix
         if domain.startswith("www."):
             domain = domain[4:]
 
         return domain
-    except:
+    except (AttributeError, TypeError, ValueError):
         return ""
 
 
@@ -160,6 +195,10 @@ def random_delay(min_seconds: float = 0.5, max_seconds: float = 2.0) -> None:
         min_seconds: Minimum delay
         max_seconds: Maximum delay
     """
+    # Nothing to wait for; skip the random draw and the sleep call
+    if max_seconds <= 0:
+        return
+
     delay = random.uniform(min_seconds, max_seconds)
     time.sleep(delay)
 
@@ -174,18 +213,9 @@ def validate_part_number(part_number: str) -> bool:
     Returns:
         True if it looks like a valid part number
     """
-    if not part_number or len(part_number) < 3:
-        return False
-
-    # Part numbers typically contain alphanumeric characters and some symbols
-    if not re.match(r"^[A-Za-z0-9\-_\.]+$", part_number):
-        return False
-
-    # Should contain at least one letter or number
-    if not re.search(r"[A-Za-z0-9]", part_number):
-        return False
-
-    return True
+    # Part numbers typically contain alphanumeric characters and some symbols,
+    # and should contain at least one letter or number
+    return bool(part_number) and _PART_RE.fullmatch(part_number) is not None
 
 
 def format_currency(amount: float, currency: str = "AUD") -> str:
@@ -17,6 +17,46 @@ from vendor_web_scraper.core.scraper_factory import get_scraper
 from vendor_web_scraper.exporters.excel_exporter import ExcelExporter
 from vendor_web_scraper import scrapers  # Import to register scrapers
 
+# Sample RS Components product markup for the extractor tests, as raw page bytes
+_SAMPLE_HTML = """
+<html>
+    <body>
+        <h1 data-testid="product-title">Sample Resistor 1kΩ</h1>
+        <span data-testid="stock-number">Stock No. 123-4567</span>
+        <div data-testid="manufacturer-name">Vishay</div>
+        <div data-testid="manufacturer-part-number">CRCW08051K00FKEA</div>
+        <div data-testid="product-description">1kΩ ±1% 0.125W 0805 Thick Film Resistor</div>
+        <div data-testid="unit-price">AU$0.15</div>
+        <div data-testid="stock-status">In Stock - 5000 available</div>
+        <img data-testid="product-image" src="//example.com/image.jpg" alt="Product">
+    </body>
+</html>
+""".encode("utf-8")
+
+# Sample RS Components product page for the pricing stream test. It has no <meta charset>,
+# and there's whitespace between the <dt> labels and their <dd> values.
+_PRICING_SAMPLE_HTML = """
+<html>
+    <body>
+        <div data-testid="pdp">
+            <h1>Widget 1kΩ</h1>
+            <dl>
+                <dt data-testid="stock-number-desktop">RS Stock No.:</dt>
+                <dd>045-8689</dd>
+            </dl>
+            <div data-testid="price-heading">Each (In a Pack of 5)</div>
+            <span data-testid="exc-vat">$2.50</span>
+            <span data-testid="inc-vat">$2.75</span>
+            <table data-testid="price-breaks">
+                <tr><th>Quantity</th><th>Unit price</th></tr>
+                <tr><td>1 - 9</td><td>$2.50</td></tr>
+                <tr><td>10 +</td><td>$2.00</td></tr>
+            </table>
+        </div>
+    </body>
+</html>
+""".encode("utf-8")
+
 def test_scraper_registration():
     """Test that scrapers are properly registered."""
     print("Testing scraper registration...")
@@ -145,34 +185,17 @@ def test_rs_components_scraper():
         print(f"   {'❌' if not is_valid else '✅'} {url}")
     
     # Test HTML parsing methods with sample HTML
-    sample_html = """
-    <html>
-        <body>
-            <h1 data-testid="product-title">Sample Resistor 1kΩ</h1>
-            <span data-testid="stock-number">Stock No. 123-4567</span>
-            <div data-testid="manufacturer-name">Vishay</div>
-            <div data-testid="manufacturer-part-number">CRCW08051K00FKEA</div>
-            <div data-testid="product-description">1kΩ ±1% 0.125W 0805 Thick Film Resistor</div>
-            <div data-testid="unit-price">AU$0.15</div>
-            <div data-testid="stock-status">In Stock - 5000 available</div>
-            <img data-testid="product-image" src="//example.com/image.jpg" alt="Product">
-        </body>
-    </html>
-    """
-    
-    soup = BeautifulSoup(sample_html, 'html.parser')
+    soup = BeautifulSoup(_SAMPLE_HTML, 'lxml')
     
     # Test extraction methods
     title = scraper._extract_title(soup)
-    part_number = scraper._extract_part_number(soup)
-    specs = scraper._extract_specifications(soup)
+    specs = scraper._extract_specifications(soup, scraper._index_test_ids(soup))
     pricing = scraper._extract_pricing(soup)
     availability = scraper._extract_availability(soup)
     media = scraper._extract_media(soup, scraper.base_url)
     
     print(f"\n   Extracted data from sample HTML:")
     print(f"   Title: {title}")
-    print(f"   Part Number: {part_number}")
     print(f"   Manufacturer: {specs.manufacturer}")
     print(f"   MPN: {specs.manufacturer_part_number}")
     print(f"   Description: {specs.description}")
@@ -181,6 +204,88 @@ def test_rs_components_scraper():
     print(f"   Stock Qty: {availability.stock_quantity}")
     print(f"   Image URL: {media.primary_image_url}")
 
+def test_rs_pricing_stream():
+    """Test that the pricing-only stream returns the same product info as the full parse."""
+    print("\nTesting RS Components pricing stream...")
+
+    from vendor_web_scraper.scrapers.rs_components import RSComponentsScraper
+
+    scraper = RSComponentsScraper()
+    url = "https://au.rs-online.com/web/p/resistors/0458689"
+
+    # The price-break hooks the full extractor accepts: the table itself, or a wrapper around it
+    table_open = b'<table data-testid="price-breaks">'
+    samples = {
+        "price-break table": _PRICING_SAMPLE_HTML,
+        "price-break class wrapper": _PRICING_SAMPLE_HTML.replace(table_open, b'<div class="price-breaks"><table>')
+        .replace(b"</table>", b"</table></div>"),
+        "price-break test id wrapper": _PRICING_SAMPLE_HTML.replace(
+            table_open, b'<div data-testid="price-breaks"><table>'
+        ).replace(b"</table>", b"</table></div>"),
+        # Sidebar pricing ahead of the product container must not be picked up
+        "sidebar pricing before the container": _PRICING_SAMPLE_HTML.replace(
+            b'<div data-testid="pdp">',
+            b'<aside><span class="price-current">$9.99</span><div class="moq">Pack of 100</div>'
+            b'<table class="quantity-pricing"><tr><td>1 +</td><td>$9.99</td></tr></table></aside>'
+            b'<div data-testid="pdp">',
+        ),
+    }
+
+    for name, html in samples.items():
+        streamed = scraper._extract_pricing_info(html, url)
+        parsed = scraper.extract_product_info(scraper._parse_html(html), url, fields={"pricing"})
+
+        assert streamed is not None, f"{name}: pricing stream fell back to the full parse"
+        assert streamed.model_dump(exclude={"scraped_at"}) == parsed.model_dump(exclude={"scraped_at"}), (
+            f"{name}: pricing stream and full parse disagree:\n{streamed}\n{parsed}"
+        )
+        print(f"✅ {name}: {streamed.title}, {streamed.vendor_part_number}, {streamed.pricing.quantity_breaks}")
+
+    # Without a price-break table the stream can't match the full parse, so it must defer to it
+    without_breaks = _PRICING_SAMPLE_HTML.replace(table_open, b"<table>")
+    assert scraper._extract_pricing_info(without_breaks, url) is None
+    print("✅ no price-break table: falls back to the full parse")
+
+    # Likewise without the data-testid="pdp" container that scopes the price hooks
+    without_container = _PRICING_SAMPLE_HTML.replace(b'<div data-testid="pdp">', b'<div class="pdp-main">')
+    assert scraper._extract_pricing_info(without_container, url) is None
+    print("✅ no product container: falls back to the full parse")
+
+def test_rs_image_srcset():
+    """Test that Cloudinary srcset candidates, which contain commas, are kept whole."""
+    print("\nTesting RS Components image srcset...")
+
+    from vendor_web_scraper.scrapers.rs_components import RSComponentsScraper
+
+    scraper = RSComponentsScraper()
+    url = "https://au.rs-online.com/web/p/resistors/0458689"
+
+    upload = "https://res.cloudinary.com/rs-designspark-live/image/upload/b_rgb:FFFFFF,c_pad,dpr_{},f_auto,q_auto"
+    expected = [f"{upload.format('1.0')},w_300/F0458689-01 1x", f"{upload.format('2.0')},w_300/F0458689-01 2x"]
+    html = (
+        f'<html><body><div data-testid="pdp"><img data-testid="gallery-fallback-image" '
+        f'src="{upload.format("1.0")},w_300/F0458689-01" srcset="{expected[0]},\n{expected[1]}">'
+        f"</div></body></html>"
+    ).encode("utf-8")
+
+    from_page = scraper._extract_media_from_html(html, url)
+    from_tree = scraper._extract_media(scraper._parse_html(html), url)
+
+    assert from_page is not None, "gallery image regex missed the sample image"
+    assert from_page.additional_images == expected, from_page.additional_images
+    assert from_tree.additional_images == expected, from_tree.additional_images
+    print(f"✅ {len(expected)} srcset candidates from both the raw page and the tree")
+
+    # A recommendation image ahead of the product container must not be read from the raw page
+    html = html.replace(
+        b'<div data-testid="pdp">',
+        b'<aside><img data-testid="gallery-fallback-image" src="/rec.jpg" srcset="/rec.jpg 1x"></aside>'
+        b'<div data-testid="pdp">',
+    )
+    from_page = scraper._extract_media_from_html(html, url)
+    assert from_page is not None and from_page.additional_images == expected, from_page
+    print("✅ gallery image read from inside the product container")
+
 if __name__ == "__main__":
     print("🧪 Running Vendor Web Scraper Tests")
     print("=" * 50)
@@ -190,6 +295,8 @@ if __name__ == "__main__":
         test_data_models()
         test_exporters()
         test_rs_components_scraper()
+        test_rs_pricing_stream()
+        test_rs_image_srcset()
         
         print("\n" + "=" * 50)
         print("✅ All tests completed successfully!")
@@ -4,12 +4,8 @@ Standalone CLI script for vendor-web-scraper.
 """
 
 import sys
-import os
 
-# Add src to path
-sys.path.insert(0, r"C:\Users\samue\detect-platform\vendor_web_scraper\src")
-
-# Import and run CLI
+# Import and run CLI from the installed package
 try:
     from vendor_web_scraper.cli import main
 
@@ -18,5 +14,5 @@ try:
 
 except ImportError as e:
     print(f"Import error: {e}")
-    print("Make sure you've run the setup script first")
+    print("Make sure the package is installed, e.g. with: pip install -e .")
     sys.exit(1)